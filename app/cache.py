@@ -0,0 +1,162 @@
+"""Response caching for the athlete service."""
+
+import time
+
+from collections import OrderedDict
+from uuid import uuid4
+
+from fastapi import Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder
+from fastapi_cache.types import Backend
+from redis import asyncio as aioredis
+
+from app.config import CACHE_NAMESPACE, LOCAL_CACHE_SIZE, LOCAL_CACHE_TTL, REDIS_URL
+
+
+class JSONResponseCoder(Coder):
+    """Cache the already-encoded body of a JSON response as raw bytes."""
+
+    @classmethod
+    def encode(cls, value: Response) -> bytes:
+        return value.body
+
+    @classmethod
+    def decode(cls, value: bytes) -> Response:
+        return Response(content=value, media_type="application/json")
+
+
+class LocalFirstBackend(Backend):
+    """Serve hot keys from a small in-process LRU before asking the shared backend."""
+
+    def __init__(self, shared: Backend, maxsize: int, ttl: int):
+        self.shared = shared
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def _get_local(self, key: str) -> tuple[int, bytes | None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0, None
+        expires_at, value = entry
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            del self._entries[key]
+            return 0, None
+        self._entries.move_to_end(key)
+        return int(remaining), value
+
+    def _set_local(self, key: str, value: bytes, expire: int | None):
+        # Redis reports -1 for keys without expiry; fall back to the local TTL
+        ttl = min(expire, self.ttl) if expire and expire > 0 else self.ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        ttl, value = self._get_local(key)
+        if value is None:
+            ttl, value = await self.shared.get_with_ttl(key)
+            if value is not None:
+                self._set_local(key, value, ttl)
+        return ttl, value
+
+    async def get(self, key: str) -> bytes | None:
+        return (await self.get_with_ttl(key))[1]
+
+    async def set(self, key: str, value: bytes, expire: int | None = None):
+        self._set_local(key, value, expire)
+        await self.shared.set(key, value, expire)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        if namespace:
+            for cached_key in [k for k in self._entries if k.startswith(namespace)]:
+                del self._entries[cached_key]
+        elif key:
+            self._entries.pop(key, None)
+        return await self.shared.clear(namespace, key)
+
+
+def init_cache():
+    """Cache responses in Redis when configured; without it caching is off.
+
+    A per-process cache would keep serving rows that another worker has
+    already changed or deleted, so there is no in-memory fallback.
+    """
+    if REDIS_URL:
+        backend = LocalFirstBackend(
+            RedisBackend(aioredis.from_url(REDIS_URL)),
+            maxsize=LOCAL_CACHE_SIZE,
+            ttl=LOCAL_CACHE_TTL,
+        )
+        FastAPICache.init(backend, prefix=CACHE_NAMESPACE)
+    else:
+        FastAPICache.init(InMemoryBackend(), prefix=CACHE_NAMESPACE, enable=False)
+
+
+def _cache_key(suffix: str) -> str:
+    """Full cache key, prefixed the way the @cache decorator does it."""
+    return f"{FastAPICache.get_prefix()}:{CACHE_NAMESPACE}:{suffix}"
+
+
+async def _list_version() -> str:
+    """Current generation of cached athlete pages.
+
+    If the cache cannot be read, a fresh version is returned so the request
+    misses and is served from the database instead of failing.
+    """
+    try:
+        version = await FastAPICache.get_backend().get(_cache_key("list-version"))
+    except Exception as e:
+        print(f"⚠️ Cache read failed, skipping cache for this page: {e}")
+        return uuid4().hex
+    return version.decode() if version else "0"
+
+
+async def athlete_list_key(_func, namespace, *, kwargs, **_):
+    """Cache key for a page of athletes, ignoring injected dependencies.
+
+    Pages are keyed by the list generation, so a write retires every page
+    by bumping one key instead of scanning Redis for them.
+    """
+    return (
+        f"{namespace}:list:{await _list_version()}:"
+        f"{kwargs['after_id']}:{kwargs['offset']}:{kwargs['limit']}"
+    )
+
+
+def athlete_key(_func, namespace, *, kwargs, **_):
+    """Cache key for a single athlete, ignoring injected dependencies."""
+    return f"{namespace}:one:{kwargs['athlete_id']}"
+
+
+async def invalidate_athlete_list():
+    """Retire every cached page of athletes after a write.
+
+    Old pages are never read again and expire on their own; other workers
+    may see the previous generation for up to LOCAL_CACHE_TTL seconds.
+    The write has already committed, so a cache failure is only logged.
+    """
+    if not FastAPICache.get_enable():
+        return
+    try:
+        await FastAPICache.get_backend().set(
+            _cache_key("list-version"), uuid4().hex.encode())
+    except Exception as e:
+        print(f"⚠️ Cache invalidation failed for athlete pages: {e}")
+
+
+async def invalidate_athlete(athlete_id: int):
+    """Drop the cached athlete and every cached page after a write."""
+    if not FastAPICache.get_enable():
+        return
+    try:
+        # FastAPICache.clear() always passes a namespace, which scans with KEYS
+        await FastAPICache.get_backend().clear(key=_cache_key(f"one:{athlete_id}"))
+    except Exception as e:
+        print(f"⚠️ Cache invalidation failed for athlete {athlete_id}: {e}")
+    await invalidate_athlete_list()
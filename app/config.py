@@ -4,11 +4,25 @@ import os
 import asyncio
 
 from typing import Annotated
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker,
+    create_async_engine,
+    AsyncSession,
+)
 
 from fastapi import Depends
+from tenacity import (
+    AsyncRetrying,
+    RetryError,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 from app.models import Base
 
 DB_USER = os.getenv("DB_USER", "postgres")
@@ -16,30 +30,119 @@ DB_PASSWORD = os.getenv("DB_PASSWORD", "postgres")
 DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "5432")
 DB_NAME = os.getenv("DB_NAME", "postgres")
+# Connections every worker of one instance may hold in total; keep it below
+# the server's max_connections (100 by default) minus other clients
+DB_CONNECTION_BUDGET = int(os.getenv("DB_CONNECTION_BUDGET", "80"))
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+_WORKER_CONNECTIONS = max(2, DB_CONNECTION_BUDGET // WEB_CONCURRENCY)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", str(_WORKER_CONNECTIONS // 2)))
+DB_MAX_OVERFLOW = int(os.getenv(
+    "DB_MAX_OVERFLOW", str(max(0, _WORKER_CONNECTIONS - DB_POOL_SIZE))))
+MAX_INFLIGHT_DB = int(os.getenv("MAX_INFLIGHT_DB", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "0") == "1"
+RUN_MIGRATIONS = os.getenv("RUN_MIGRATIONS", "1") == "1"
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_NAMESPACE = "athlete"
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))
+# Upper bound on how stale another worker's in-process copy can be after a write
+LOCAL_CACHE_TTL = 5
+LOCAL_CACHE_SIZE = 256
 
 # Use asyncpg driver for async operations
 DB_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-CONNECT_ARGS = {"echo": False, "future": True}
+# Used for every pooled connection: SQLAlchemy's asyncpg dialect keeps the
+# prepared_statement_* keys for itself and hands the rest to asyncpg.connect()
+CONNECT_ARGS = {
+    "server_settings": {"application_name": "athlete-service", "jit": "off"},
+    "statement_cache_size": 2048,
+    "prepared_statement_cache_size": 512,
+}
+if DB_PGBOUNCER:
+    # Transaction pooling may run each statement on a different backend, so
+    # named prepared statements must be unique and never reused
+    CONNECT_ARGS.update(
+        statement_cache_size=0,
+        prepared_statement_cache_size=0,
+        prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+    )
 
-engine = create_async_engine(DB_URL, **CONNECT_ARGS)
-async_session = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False)
+engine = create_async_engine(
+    DB_URL,
+    echo=False,
+    future=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=10,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    connect_args=CONNECT_ARGS,
+)
+async_session = async_sessionmaker(
+    engine, expire_on_commit=False, autoflush=False)
+
+
+# 8 attempts back off 0.5s..5s, about 22s in total
+DB_CONNECT_ATTEMPTS = 8
+# Errors raised while PostgreSQL is still starting or unreachable
+TRANSIENT_DB_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.CannotConnectNowError,
+)
+
+
+def is_transient_db_error(exc: BaseException) -> bool:
+    """Tell connection failures worth retrying apart from real bugs."""
+    if isinstance(exc, DBAPIError):
+        exc = exc.orig.__cause__ or exc.orig
+    return isinstance(exc, TRANSIENT_DB_ERRORS)
+
+
+def log_db_retry(retry_state):
+    """Report a failed connection attempt before backing off."""
+    print(
+        f"❌ DB connection failed (attempt {retry_state.attempt_number}/"
+        f"{DB_CONNECT_ATTEMPTS}): {retry_state.outcome.exception()}")
 
 
 async def create_db_and_tables():
-    """Try to connect to DB with retries."""
-    retries = 5
-    for i in range(retries):
-        try:
-            async with engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all, checkfirst=True)
-            print("✅ DB connection successful.")
-            break
-        except Exception as e:
-            print(f"❌ DB connection failed (attempt {i + 1}/{retries}): {e}")
-            await asyncio.sleep(3)
-    else:
-        raise RuntimeError("Could not connect to the database after retries")
+    """Connect to DB with backoff and create tables when RUN_MIGRATIONS is on."""
+    retrying = AsyncRetrying(
+        stop=stop_after_attempt(DB_CONNECT_ATTEMPTS),
+        wait=wait_exponential(multiplier=0.5, max=5),
+        retry=retry_if_exception(is_transient_db_error),
+        before_sleep=log_db_retry,
+    )
+    try:
+        async for attempt in retrying:
+            with attempt:
+                async with engine.begin() as conn:
+                    if RUN_MIGRATIONS:
+                        await conn.run_sync(Base.metadata.create_all, checkfirst=True)
+    except RetryError as e:
+        raise RuntimeError(
+            "Could not connect to the database after retries"
+        ) from e.last_attempt.exception()
+    print("✅ DB connection successful.")
+
+
+async def warm_db_pool():
+    """Open pool_size connections up front so first requests skip connect.
+
+    Best effort: a failed connection is only logged and opened on demand later.
+    """
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(
+        *(ping() for _ in range(DB_POOL_SIZE)), return_exceptions=True)
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        print(
+            f"⚠️ Pool warm-up opened {DB_POOL_SIZE - len(failures)}/{DB_POOL_SIZE} "
+            f"connections: {failures[0]}")
 
 
 async def get_session():
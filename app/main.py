@@ -1,18 +1,29 @@
 """FastAPI application with basic endpoints."""
 
+import asyncio
+import json
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy import text
 import logfire
-from app.config import create_db_and_tables, engine
+from app.cache import init_cache
+from app.config import (
+    MAX_INFLIGHT_DB,
+    TRACE_SAMPLE_RATE,
+    create_db_and_tables,
+    engine,
+    warm_db_pool,
+)
 from app.router import router as athlete_router
 
 
 logfire.configure(
     service_name="athlete-service",
     send_to_logfire=False,
+    sampling=logfire.SamplingOptions(head=TRACE_SAMPLE_RATE),
 )
 
 
@@ -20,39 +31,84 @@ logfire.configure(
 async def lifespan(_fastapi_app: FastAPI):
     """Create the database and tables on startup."""
     await create_db_and_tables()
+    await warm_db_pool()
+    init_cache()
     yield
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(athlete_router)
 
+# Extra athlete requests wait here instead of timing out on pool checkout
+_db_semaphore = asyncio.Semaphore(MAX_INFLIGHT_DB)
+
+
+@app.middleware("http")
+async def limit_db_concurrency(request: Request, call_next):
+    """Cap concurrent athlete requests at what the connection pool can serve."""
+    if not request.url.path.startswith(athlete_router.prefix):
+        return await call_next(request)
+    async with _db_semaphore:
+        return await call_next(request)
+
+
+# Liveness body never changes, so encode it once
+_HEALTH_BODY = json.dumps({"status": "ok", "service": "athlete-service"}).encode()
+
+# Readiness result is reused for this many seconds so probe bursts hit the DB once
+READY_CACHE_TTL = 2.0
+_ready_lock = asyncio.Lock()
+_ready_state: tuple[float, str | None] = (float("-inf"), None)
+
+
+async def check_database() -> str | None:
+    """Return None if the database answers, otherwise the error message."""
+    global _ready_state
+    async with _ready_lock:
+        checked_at, error = _ready_state
+        if time.monotonic() - checked_at < READY_CACHE_TTL:
+            return error
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            error = None
+        except Exception as e:
+            error = str(e)
+        _ready_state = (time.monotonic(), error)
+        return error
+
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint to verify API and database status."""
-    try:
-        # Check database connection
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "healthy",
-                "service": "athlete-service",
-                "database": "connected",
-                "timestamp": datetime.now().isoformat()
-            }
-        )
-    except Exception as e:
+    """Liveness check endpoint, does not touch the database."""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness check endpoint to verify API and database status."""
+    error = await check_database()
+    if error is not None:
         raise HTTPException(
             status_code=503,
             detail={
                 "status": "unhealthy",
                 "service": "athlete-service",
                 "database": "disconnected",
-                "error": str(e)
+                "error": error
             }
-        ) from e
+        )
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "status": "healthy",
+            "service": "athlete-service",
+            "database": "connected",
+            "timestamp": datetime.now().isoformat()
+        }
+    )
 
-logfire.instrument_fastapi(app)
+# Probe traffic is high-volume and carries no useful trace data; matched
+# against the full request URL, so the pattern is anchored only at the end
+logfire.instrument_fastapi(app, excluded_urls="/health(/ready)?$")
@@ -4,7 +4,8 @@ from datetime import date, datetime
 from typing import Optional
 from sqlalchemy import Column, Integer, String, Date, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
-from pydantic import BaseModel
+from sqlalchemy.sql import func
+from pydantic import BaseModel, ConfigDict
 
 Base = declarative_base()
 
@@ -16,20 +17,23 @@ class Athlete(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     country = Column(String, index=True)
-    birth_date = Column(Date, index=True)
-    height = Column(Integer, index=True)
-    weight = Column(Integer, index=True)
+    birth_date = Column(Date)
+    height = Column(Integer)
+    weight = Column(Integer)
     sport = Column(String, index=True)
-    nick_name = Column(String, index=True)
-    bio = Column(Text, index=True)
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    nick_name = Column(String)
+    bio = Column(Text)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     deleted_at = Column(DateTime, nullable=True)
 
 
 # Pydantic models for API
 class AthleteBase(BaseModel):
     """Base class for all athletes."""
+    model_config = ConfigDict(from_attributes=True)
+
     # Personal Data
     name: str
     country: str
@@ -42,9 +46,6 @@ class AthleteBase(BaseModel):
     nick_name: str
     bio: str
 
-    class Config:
-        from_attributes = True
-
 
 class AthletePublic(AthleteBase):
     """Represents an athlete with public information."""
@@ -57,6 +58,12 @@ class AthletePublic(AthleteBase):
     updated_at: datetime
 
 
+class AthletePage(BaseModel):
+    """Represents a page of athletes with the cursor for the next page."""
+    items: list[AthletePublic]
+    next_cursor: Optional[int] = None
+
+
 class AthleteCreate(AthleteBase):
     """Represents an athlete to be created."""
     pass
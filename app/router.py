@@ -2,12 +2,21 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Body, HTTPException, Query, Response
+from fastapi_cache.decorator import cache
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import SessionDep
-from app.models import Athlete, AthleteCreate, AthletePublic, AthleteUpdate
+from app.cache import (
+    JSONResponseCoder,
+    athlete_key,
+    athlete_list_key,
+    invalidate_athlete,
+    invalidate_athlete_list,
+)
+from app.config import CACHE_NAMESPACE, SessionDep, engine
+from app.models import Athlete, AthleteCreate, AthletePage, AthletePublic, AthleteUpdate
 
 
 router = APIRouter(
@@ -15,69 +24,138 @@ router = APIRouter(
     tags=["athletes"],
 )
 
+# Largest list accepted by POST /athletes/bulk
+MAX_BULK_ATHLETES = 100
+
+# Built once at import; validate a whole result set in one pydantic-core call
+_ATHLETE_ADAPTER = TypeAdapter(AthletePublic)
+_ATHLETE_LIST_ADAPTER = TypeAdapter(list[AthletePublic])
+_ATHLETE_PAGE_ADAPTER = TypeAdapter(AthletePage)
+
+# Read routes select only what AthletePublic exposes
+_PUBLIC_COLUMNS = [Athlete.__table__.c[name] for name in AthletePublic.model_fields]
+# Built once; each request only binds the ID
+_SELECT_ATHLETE = select(*_PUBLIC_COLUMNS).where(Athlete.id == bindparam("athlete_id"))
+
+
+def json_response(content: bytes) -> Response:
+    """Send already-encoded JSON without another serialization pass."""
+    return Response(content=content, media_type="application/json")
 
-@router.post("/")
+
+@router.post("/", response_model=AthletePublic)
 async def create_athlete(athlete: AthleteCreate, session: SessionDep):
     """Create a new athlete."""
-    db_athlete = Athlete(**athlete.model_dump())
-    session.add(db_athlete)
-    await session.commit()
-    await session.refresh(db_athlete)
+    statement = insert(Athlete).values(**athlete.model_dump()).returning(Athlete)
+    async with session.begin():
+        db_athlete = await session.scalar(statement)
+    await invalidate_athlete_list()
     return db_athlete
 
 
-@router.get("/", response_model=list[AthletePublic])
-async def get_athletes(
+@router.post("/bulk", response_model=list[AthletePublic])
+async def create_athletes(
+    athletes: Annotated[list[AthleteCreate], Body(max_length=MAX_BULK_ATHLETES)],
     session: SessionDep,
-    offset: int = 0,
-    limit: Annotated[int, Query(le=100)] = 100,
 ):
-    """Get a list of athletes."""
-    statement = select(Athlete).offset(offset).limit(limit)
-    result = await session.execute(statement)
-    athletes = result.scalars().all()
-    return athletes
-
-
-@router.get("/{athlete_id}", response_model=AthletePublic)
-async def get_athlete(athlete_id: int, session: SessionDep):
+    """Create several athletes with a single multi-row INSERT."""
+    if not athletes:
+        return []
+
+    # Return rows in request order; without this batched inserts may reorder them
+    statement = insert(Athlete).returning(Athlete, sort_by_parameter_order=True)
+    async with session.begin():
+        result = await session.scalars(statement, [a.model_dump() for a in athletes])
+        db_athletes = result.all()
+    await invalidate_athlete_list()
+    return db_athletes
+
+
+@router.get("/", responses={200: {"model": AthletePage}})
+@cache(
+    expire=30,
+    namespace=CACHE_NAMESPACE,
+    key_builder=athlete_list_key,
+    coder=JSONResponseCoder,
+)
+async def get_athletes(
+    after_id: int = 0,
+    limit: Annotated[int, Query(ge=1, le=100)] = 100,
+    offset: Annotated[int, Query(deprecated=True)] = 0,
+):
+    """Get a page of athletes ordered by ID, starting after `after_id`.
+
+    Reads use a plain Core connection opened here rather than a dependency,
+    so cache hits never check one out of the pool.
+    """
+    statement = (
+        select(*_PUBLIC_COLUMNS)
+        .where(Athlete.id > after_id)
+        .order_by(Athlete.id)
+    )
+    if offset:
+        statement = statement.offset(offset)
+    async with engine.connect() as conn:
+        result = await conn.execute(statement.limit(limit))
+        rows = result.mappings().all()
+    page = AthletePage(
+        items=_ATHLETE_LIST_ADAPTER.validate_python(rows),
+        # A short page is the last one
+        next_cursor=rows[-1]["id"] if len(rows) == limit else None,
+    )
+    return json_response(_ATHLETE_PAGE_ADAPTER.dump_json(page))
+
+
+@router.get("/{athlete_id}", responses={200: {"model": AthletePublic}})
+@cache(
+    expire=60,
+    namespace=CACHE_NAMESPACE,
+    key_builder=athlete_key,
+    coder=JSONResponseCoder,
+)
+async def get_athlete(athlete_id: int):
     """Get an athlete by ID."""
-    statement = select(Athlete).where(Athlete.id == athlete_id)
-    result = await session.execute(statement)
-    athlete = result.scalar_one_or_none()
-    if not athlete:
+    async with engine.connect() as conn:
+        result = await conn.execute(_SELECT_ATHLETE, {"athlete_id": athlete_id})
+        athlete = result.mappings().first()
+    if athlete is None:
         raise HTTPException(status_code=404, detail="Athlete not found")
-    return athlete
+    public = _ATHLETE_ADAPTER.validate_python(athlete)
+    return json_response(_ATHLETE_ADAPTER.dump_json(public))
 
 
 @router.patch("/{athlete_id}", response_model=AthletePublic)
 async def update_athlete(athlete_id: int, athlete: AthleteUpdate, session: SessionDep):
     """Update an athlete."""
-    statement = select(Athlete).where(Athlete.id == athlete_id)
-    result = await session.execute(statement)
-    db_athlete = result.scalar_one_or_none()
-    if not db_athlete:
-        raise HTTPException(status_code=404, detail="Athlete not found")
-
     athlete_data = athlete.model_dump(exclude_unset=True)
-    for key, value in athlete_data.items():
-        setattr(db_athlete, key, value)
-
-    session.add(db_athlete)
-    await session.commit()
-    await session.refresh(db_athlete)
+    if not athlete_data:
+        db_athlete = await session.get(Athlete, athlete_id)
+        if not db_athlete:
+            raise HTTPException(status_code=404, detail="Athlete not found")
+        return db_athlete
+
+    statement = (
+        update(Athlete)
+        .where(Athlete.id == athlete_id)
+        .values(**athlete_data)
+        .returning(Athlete)
+    )
+    async with session.begin():
+        db_athlete = await session.scalar(statement)
+        if not db_athlete:
+            raise HTTPException(status_code=404, detail="Athlete not found")
+
+    await invalidate_athlete(athlete_id)
     return db_athlete
 
 
 @router.delete("/{athlete_id}")
 async def delete_athlete(athlete_id: int, session: SessionDep):
     """Delete an athlete."""
-    statement = select(Athlete).where(Athlete.id == athlete_id)
-    result = await session.execute(statement)
-    athlete = result.scalar_one_or_none()
-    if not athlete:
-        raise HTTPException(status_code=404, detail="Athlete not found")
+    statement = delete(Athlete).where(Athlete.id == athlete_id).returning(Athlete.id)
+    async with session.begin():
+        if await session.scalar(statement) is None:
+            raise HTTPException(status_code=404, detail="Athlete not found")
 
-    await session.delete(athlete)
-    await session.commit()
+    await invalidate_athlete(athlete_id)
     return {"message": "Athlete deleted"}
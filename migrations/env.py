@@ -0,0 +1,43 @@
+"""Alembic environment for the athlete service."""
+
+import asyncio
+
+from alembic import context
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import DB_URL
+from app.models import Base
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """Emit migration SQL without connecting to the database."""
+    context.configure(
+        url=DB_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection):
+    """Run migrations on a sync connection handed over by the async engine."""
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online():
+    """Run migrations against the configured database."""
+    connectable = create_async_engine(DB_URL)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,44 @@
+"""Create athlete table
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0000"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # IF NOT EXISTS so databases already created by create_all can upgrade
+    op.create_table(
+        "athlete",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("country", sa.String(), nullable=True),
+        sa.Column("birth_date", sa.Date(), nullable=True),
+        sa.Column("height", sa.Integer(), nullable=True),
+        sa.Column("weight", sa.Integer(), nullable=True),
+        sa.Column("sport", sa.String(), nullable=True),
+        sa.Column("nick_name", sa.String(), nullable=True),
+        sa.Column("bio", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    for column in ("id", "name", "country", "sport"):
+        op.create_index(
+            f"ix_athlete_{column}", "athlete", [column], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_table("athlete")
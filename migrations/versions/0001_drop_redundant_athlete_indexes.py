@@ -0,0 +1,39 @@
+"""Drop redundant athlete indexes
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+revision = "0001"
+down_revision = "0000"
+branch_labels = None
+depends_on = None
+
+DROPPED_COLUMNS = ("birth_date", "height", "weight", "nick_name", "bio")
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for column in DROPPED_COLUMNS:
+            op.drop_index(
+                f"ix_athlete_{column}",
+                table_name="athlete",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for column in DROPPED_COLUMNS:
+            op.create_index(
+                f"ix_athlete_{column}",
+                "athlete",
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
@@ -0,0 +1,37 @@
+"""Stamp athlete timestamps on the server
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for column in ("created_at", "updated_at"):
+        op.execute(f"UPDATE athlete SET {column} = now() WHERE {column} IS NULL")
+        op.alter_column(
+            "athlete",
+            column,
+            existing_type=sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        )
+
+
+def downgrade():
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "athlete",
+            column,
+            existing_type=sa.DateTime(),
+            nullable=True,
+            server_default=None,
+        )
@@ -0,0 +1,184 @@
+"""Tests for LocalFirstBackend and athlete cache invalidation."""
+
+import asyncio
+
+import pytest
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app import cache
+from app.cache import (
+    LocalFirstBackend,
+    athlete_list_key,
+    invalidate_athlete,
+    invalidate_athlete_list,
+)
+from app.config import CACHE_NAMESPACE
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def shared():
+    backend = InMemoryBackend()
+    # The store is a class attribute; give each test its own
+    backend._store = {}
+    return backend
+
+
+def test_local_entry_expires_after_local_ttl(clock, shared):
+    backend = LocalFirstBackend(shared, maxsize=8, ttl=5)
+    asyncio.run(backend.set("k", b"v", expire=60))
+
+    clock.now += 4
+    assert backend._get_local("k") == (1, b"v")
+
+    clock.now += 2
+    assert backend._get_local("k") == (0, None)
+    assert "k" not in backend._entries
+
+
+def test_local_entry_honours_shorter_shared_expiry(clock, shared):
+    backend = LocalFirstBackend(shared, maxsize=8, ttl=5)
+    asyncio.run(backend.set("k", b"v", expire=2))
+
+    clock.now += 3
+    assert backend._get_local("k") == (0, None)
+
+
+def test_key_without_shared_expiry_uses_local_ttl(clock, shared):
+    backend = LocalFirstBackend(shared, maxsize=8, ttl=5)
+    # Redis reports -1 for keys stored without an expiry
+    backend._set_local("k", b"v", -1)
+
+    assert backend._get_local("k") == (5, b"v")
+
+
+def test_shared_hit_fills_local_cache(clock, shared):
+    asyncio.run(shared.set("k", b"v", expire=60))
+    backend = LocalFirstBackend(shared, maxsize=8, ttl=5)
+
+    assert asyncio.run(backend.get("k")) == b"v"
+    assert "k" in backend._entries
+
+
+def test_least_recently_used_entry_is_evicted(clock, shared):
+    backend = LocalFirstBackend(shared, maxsize=2, ttl=5)
+    backend._set_local("a", b"1", 60)
+    backend._set_local("b", b"2", 60)
+    backend._get_local("a")
+    backend._set_local("c", b"3", 60)
+
+    assert list(backend._entries) == ["a", "c"]
+
+
+def test_clear_namespace_drops_matching_keys(clock, shared):
+    backend = LocalFirstBackend(shared, maxsize=8, ttl=5)
+    asyncio.run(backend.set("athlete:one:1", b"1", expire=60))
+    asyncio.run(backend.set("other:one:1", b"2", expire=60))
+
+    asyncio.run(backend.clear(namespace="athlete"))
+
+    assert list(backend._entries) == ["other:one:1"]
+    assert asyncio.run(shared.get("athlete:one:1")) is None
+    assert asyncio.run(shared.get("other:one:1")) == b"2"
+
+
+def test_clear_key_drops_only_that_key(clock, shared):
+    backend = LocalFirstBackend(shared, maxsize=8, ttl=5)
+    asyncio.run(backend.set("athlete:one:1", b"1", expire=60))
+    asyncio.run(backend.set("athlete:one:2", b"2", expire=60))
+
+    asyncio.run(backend.clear(key="athlete:one:1"))
+
+    assert list(backend._entries) == ["athlete:one:2"]
+    assert asyncio.run(shared.get("athlete:one:1")) is None
+    assert asyncio.run(shared.get("athlete:one:2")) == b"2"
+
+
+@pytest.fixture
+def fastapi_cache(shared):
+    FastAPICache.init(shared, prefix=CACHE_NAMESPACE)
+    yield shared
+    FastAPICache.reset()
+
+
+def list_key() -> str:
+    kwargs = {"after_id": 0, "offset": 0, "limit": 100}
+    return asyncio.run(athlete_list_key(None, "athlete:athlete", kwargs=kwargs))
+
+
+def test_list_write_moves_pages_to_a_new_key(fastapi_cache):
+    before = list_key()
+    asyncio.run(invalidate_athlete_list())
+    after = list_key()
+
+    assert before != after
+    asyncio.run(invalidate_athlete_list())
+    assert list_key() != after
+
+
+def test_athlete_write_drops_its_key_and_retires_pages(fastapi_cache):
+    asyncio.run(fastapi_cache.set("athlete:athlete:one:1", b"1", expire=60))
+    asyncio.run(fastapi_cache.set("athlete:athlete:one:2", b"2", expire=60))
+    before = list_key()
+
+    asyncio.run(invalidate_athlete(1))
+
+    assert asyncio.run(fastapi_cache.get("athlete:athlete:one:1")) is None
+    assert asyncio.run(fastapi_cache.get("athlete:athlete:one:2")) == b"2"
+    assert list_key() != before
+
+
+def test_invalidation_is_a_no_op_when_caching_is_off(shared):
+    FastAPICache.init(shared, prefix=CACHE_NAMESPACE, enable=False)
+    try:
+        asyncio.run(invalidate_athlete(1))
+    finally:
+        FastAPICache.reset()
+
+    assert shared._store == {}
+
+
+class BrokenBackend(InMemoryBackend):
+    """Shared backend that fails like an unreachable Redis."""
+
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+    async def set(self, key, value, expire=None):
+        raise ConnectionError("redis down")
+
+    async def clear(self, namespace=None, key=None):
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture
+def broken_cache():
+    FastAPICache.init(BrokenBackend(), prefix=CACHE_NAMESPACE)
+    yield
+    FastAPICache.reset()
+
+
+def test_unreadable_cache_gives_each_page_a_fresh_key(broken_cache):
+    assert list_key() != list_key()
+
+
+def test_invalidation_survives_an_unreachable_cache(broken_cache):
+    asyncio.run(invalidate_athlete(1))
+    asyncio.run(invalidate_athlete_list())
@@ -0,0 +1,41 @@
+"""Tests for the startup retry predicate."""
+
+import asyncio
+
+import asyncpg
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from app.config import is_transient_db_error
+
+
+def wrapped(cause: BaseException) -> DBAPIError:
+    """Wrap an error the way SQLAlchemy's asyncpg dialect does."""
+    orig = Exception(str(cause))
+    orig.__cause__ = cause
+    return DBAPIError("SELECT 1", None, orig)
+
+
+@pytest.mark.parametrize("exc", [
+    ConnectionRefusedError(111, "Connection refused"),
+    asyncio.TimeoutError(),
+    asyncpg.CannotConnectNowError("the database system is starting up"),
+    asyncpg.ConnectionDoesNotExistError("connection was closed"),
+])
+def test_connection_failures_are_retried(exc):
+    assert is_transient_db_error(exc)
+    assert is_transient_db_error(wrapped(exc))
+
+
+@pytest.mark.parametrize("exc", [
+    asyncpg.InvalidPasswordError("password authentication failed"),
+    asyncpg.UndefinedTableError('relation "athlete" does not exist'),
+    ValueError("bug"),
+])
+def test_other_errors_are_not_retried(exc):
+    assert not is_transient_db_error(exc)
+    assert not is_transient_db_error(wrapped(exc))
+
+
+def test_dbapi_error_without_cause_uses_orig():
+    assert is_transient_db_error(DBAPIError("SELECT 1", None, OSError("reset")))
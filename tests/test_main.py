@@ -0,0 +1,48 @@
+"""Tests for the liveness and readiness probes."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+@pytest.fixture
+def client():
+    # Lifespan is not run, so nothing connects to the database
+    return TestClient(main.app)
+
+
+def test_liveness_does_not_touch_the_database(client, monkeypatch):
+    async def fail():
+        raise AssertionError("liveness must not check the database")
+
+    monkeypatch.setattr(main, "check_database", fail)
+
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "service": "athlete-service"}
+
+
+def test_readiness_reports_a_reachable_database(client, monkeypatch):
+    async def ok():
+        return None
+
+    monkeypatch.setattr(main, "check_database", ok)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["database"] == "connected"
+
+
+def test_readiness_fails_when_the_database_is_down(client, monkeypatch):
+    async def down():
+        return "connection refused"
+
+    monkeypatch.setattr(main, "check_database", down)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["detail"]["error"] == "connection refused"
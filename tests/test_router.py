@@ -0,0 +1,117 @@
+"""Tests for the athlete routes that need no database."""
+
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app import router
+from app.main import app
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeEngine:
+    """Stand-in for the engine that returns the rows the query would get."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def connect(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, *_args):
+        return FakeResult(self.rows)
+
+
+def athlete_row(athlete_id: int) -> dict:
+    return {
+        "id": athlete_id,
+        "name": f"Athlete {athlete_id}",
+        "country": "BR",
+        "birth_date": "2000-01-01",
+        "height": 180,
+        "weight": 75,
+        "sport": "Football",
+        "nick_name": f"A{athlete_id}",
+        "bio": "",
+        "created_at": "2025-01-01T00:00:00",
+        "updated_at": "2025-01-01T00:00:00",
+    }
+
+
+@pytest.fixture
+def client():
+    # Lifespan is not run, so nothing connects to the database or Redis
+    FastAPICache.init(InMemoryBackend(), prefix="athlete", enable=False)
+    yield TestClient(app)
+    FastAPICache.reset()
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    engine = FakeEngine([])
+    monkeypatch.setattr(router, "engine", engine)
+    return engine
+
+
+def test_full_page_points_at_the_last_row(client, rows):
+    rows.rows = [athlete_row(1), athlete_row(2)]
+
+    response = client.get("/athletes/", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] == 2
+
+
+def test_short_page_has_no_cursor(client, rows):
+    rows.rows = [athlete_row(1)]
+
+    response = client.get("/athletes/", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [athlete_row(1)], "next_cursor": None}
+
+
+def test_empty_page_has_no_cursor(client, rows):
+    response = client.get("/athletes/", params={"after_id": 99})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.parametrize("limit", [0, -1, 101])
+def test_limit_out_of_range_is_rejected(client, rows, limit):
+    response = client.get("/athletes/", params={"limit": limit})
+
+    assert response.status_code == 422
+
+
+def test_bulk_create_rejects_too_many_athletes(client):
+    body = [athlete_row(i) for i in range(router.MAX_BULK_ATHLETES + 1)]
+
+    response = client.post("/athletes/bulk", json=body)
+
+    assert response.status_code == 422
+
+
+def test_bulk_create_of_nothing_skips_the_database(client):
+    response = client.post("/athletes/bulk", json=[])
+
+    assert response.status_code == 200
+    assert response.json() == []